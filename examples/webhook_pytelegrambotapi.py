@@ -0,0 +1,62 @@
+"""
+Calendar served over a webhook with async pyTelegramBotAPI and aiohttp instead of polling.
+"""
+
+from aiohttp import web
+from telebot import types
+from telebot.async_telebot import AsyncTeleBot
+
+from telegram_bot_calendar import DetailedTelegramCalendar, LSTEP
+
+TOKEN = "token"
+WEBHOOK_HOST = "https://example.com"
+WEBHOOK_PATH = f"/{TOKEN}"
+
+bot = AsyncTeleBot(TOKEN)
+
+
+@bot.message_handler(commands=['start'])
+async def start(m):
+    calendar, step = DetailedTelegramCalendar().build()
+    await bot.send_message(m.chat.id,
+                           f"Select {LSTEP[step]}",
+                           reply_markup=calendar)
+
+
+@bot.callback_query_handler(func=DetailedTelegramCalendar.func())
+async def cal(c):
+    result, key, step = DetailedTelegramCalendar().process(c.data)
+    if not result and key:
+        await bot.edit_message_text(f"Select {LSTEP[step]}",
+                                    c.message.chat.id,
+                                    c.message.message_id,
+                                    reply_markup=key)
+    elif result:
+        await bot.edit_message_text(f"You selected {result}",
+                                    c.message.chat.id,
+                                    c.message.message_id)
+
+
+async def handle(request):
+    update = types.Update.de_json(await request.json())
+    await bot.process_new_updates([update])
+    return web.Response()
+
+
+async def on_startup(app):
+    await bot.remove_webhook()
+    await bot.set_webhook(url=WEBHOOK_HOST + WEBHOOK_PATH)
+
+
+async def on_shutdown(app):
+    await bot.remove_webhook()
+    await bot.close_session()
+
+
+app = web.Application()
+app.router.add_post(WEBHOOK_PATH, handle)
+app.on_startup.append(on_startup)
+app.on_shutdown.append(on_shutdown)
+
+# TLS is expected to be terminated by a reverse proxy in front of this server
+web.run_app(app, host="0.0.0.0", port=8080)
@@ -92,9 +92,13 @@ class TelegramCalendar:
 
     @staticmethod
     def func(calendar_id=0, telethon=False):
+        # the prefix is built once here since the filter runs for every callback query
+        start = CB_CALENDAR + "_" + str(calendar_id)
+        # telethon passes raw bytes, so they are compared with the encoded prefix without decoding
+        start_bytes = start.encode("utf-8")
+
         def inn(callback):
-            start = CB_CALENDAR + "_" + str(calendar_id)
-            return callback.decode("utf-8").startswith(start) if telethon else callback.data.startswith(start)
+            return callback.startswith(start_bytes) if telethon else callback.data.startswith(start)
 
         return inn
 
@@ -121,13 +125,13 @@ class TelegramCalendar:
         if action == NOTHING:
             params = [CB_CALENDAR, str(self.calendar_id), action]
         else:
-            data = list(map(str, data.timetuple()[:3]))
+            data = [str(data.year), str(data.month), str(data.day)]
             params = [CB_CALENDAR, str(self.calendar_id), action, step] + data
 
         # Random is used here to protect bots from being spammed by some 'smart' users.
         # Random callback data will not produce api errors "Message is not modified".
-        # However, there is still a chance (1 in 1e18) that the same callbacks are created.
-        salt = "_" + str(random.randint(1, 1e18)) if is_random else ""
+        # However, there is still a chance (1 in 2^60, about 1e18) that the same callbacks are created.
+        salt = "_" + str(random.getrandbits(60)) if is_random else ""
 
         return "_".join(params) + salt
 
@@ -149,7 +153,7 @@ class TelegramCalendar:
         """
         Build keyboard in json to send to Telegram API over HTTP.
         """
-        return json.dumps({"inline_keyboard": buttons + self.additional_buttons})
+        return json.dumps({"inline_keyboard": buttons + self.additional_buttons}, separators=(',', ':'))
 
     def _valid_date(self, d):
         return self.min_date <= d <= self.max_date
@@ -1,4 +1,5 @@
 from calendar import monthrange
+from functools import lru_cache
 
 from telegram_bot_calendar.base import *
 
@@ -6,6 +7,15 @@ STEPS = {YEAR: MONTH, MONTH: DAY}
 
 PREV_STEPS = {DAY: MONTH, MONTH: YEAR, YEAR: YEAR}
 PREV_ACTIONS = {DAY: GOTO, MONTH: GOTO, YEAR: NOTHING}
+CB_PARAMS = ("start", "calendar_id", "action", "step", "year", "month", "day")
+
+
+@lru_cache(maxsize=256)
+def _month_weeks(year, month, firstweekday):
+    """
+    Cached month grid: weeks of day numbers starting from firstweekday, 0 for days outside the month.
+    """
+    return tuple(tuple(week) for week in calendar.Calendar(firstweekday).monthdayscalendar(year, month))
 
 
 class DetailedTelegramCalendar(TelegramCalendar):
@@ -32,8 +42,7 @@ class DetailedTelegramCalendar(TelegramCalendar):
 
     def _process(self, call_data, *args, **kwargs):
         params = call_data.split("_")
-        params = dict(
-            zip(["start", "calendar_id", "action", "step", "year", "month", "day"][:len(params)], params))
+        params = dict(zip(CB_PARAMS, params))
 
         if params['action'] == NOTHING:
             return None, None, None
@@ -126,9 +135,11 @@ class DetailedTelegramCalendar(TelegramCalendar):
 
         text = self.nav_buttons[step]
 
-        sld = list(map(str, self.current_date.timetuple()[:3]))
-        data = [sld[0], self.months[self.locale][int(sld[1]) - 1], sld[2]]
-        data = dict(zip(["year", "month", "day"], data))
+        data = {
+            "year": str(self.current_date.year),
+            "month": self.months[self.locale][self.current_date.month - 1],
+            "day": str(self.current_date.day),
+        }
         prev_page = self.current_date - diff
         next_page = self.current_date + diff
 
@@ -136,11 +147,11 @@ class DetailedTelegramCalendar(TelegramCalendar):
         next_exists = maxd + relativedelta(**{LSTEP[step] + "s": 1}) <= self.max_date
 
         return [[
-            self._build_button(text[0].format(**data) if prev_exists else self.empty_nav_button,
+            self._build_button(text[0].format_map(data) if prev_exists else self.empty_nav_button,
                                GOTO if prev_exists else NOTHING, step, prev_page, is_random=self.is_random),
-            self._build_button(text[1].format(**data),
+            self._build_button(text[1].format_map(data),
                                PREV_ACTIONS[step], PREV_STEPS[step], self.current_date, is_random=self.is_random),
-            self._build_button(text[2].format(**data) if next_exists else self.empty_nav_button,
+            self._build_button(text[2].format_map(data) if next_exists else self.empty_nav_button,
                                GOTO if next_exists else NOTHING, step, next_page, is_random=self.is_random),
         ]]
 
@@ -149,12 +160,10 @@ class DetailedTelegramCalendar(TelegramCalendar):
             return super(DetailedTelegramCalendar, self)._get_period(step, start, diff, *args, **kwargs)
 
         dates = []
-        cl = calendar.monthcalendar(start.year, start.month)
+        cl = _month_weeks(start.year, start.month, calendar.firstweekday())
         for week in cl:
             for day in week:
-                if day != 0 and self._valid_date(date(start.year, start.month, day)):
-                    dates.append(date(start.year, start.month, day))
-                else:
-                    dates.append(None)
+                d = date(start.year, start.month, day) if day != 0 else None
+                dates.append(d if d and self._valid_date(d) else None)
 
         return dates
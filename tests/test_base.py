@@ -49,3 +49,14 @@ def test__get_period(min_date, max_date, step, start, diff, period):
                           (22, 'cbcal_22_n', True), ])
 def test_func(calendar_id, callback_data, passed):
     assert TelegramCalendar.func(calendar_id)(SimpleNamespace(data=callback_data)) == passed
+    assert TelegramCalendar.func(calendar_id, telethon=True)(callback_data.encode("utf-8")) == passed
+
+
+@pytest.mark.parametrize(('action', 'step', 'data', 'is_random', 'prefix', 'parts'),
+                         [('s', DAY, date(2021, 1, 5), False, 'cbcal_0_s_d_2021_1_5', 7),
+                          ('s', DAY, date(2021, 1, 5), True, 'cbcal_0_s_d_2021_1_5_', 8),
+                          ('n', None, None, True, 'cbcal_0_n_', 4), ])
+def test__build_callback(action, step, data, is_random, prefix, parts):
+    callback = TelegramCalendar()._build_callback(action, step, data, is_random=is_random)
+
+    assert callback.startswith(prefix) and len(callback.split('_')) == parts
@@ -7,7 +7,7 @@ import pytest
 from dateutil.relativedelta import relativedelta
 
 from telegram_bot_calendar import DAY, MONTH, YEAR
-from telegram_bot_calendar.detailed import DetailedTelegramCalendar, NOTHING
+from telegram_bot_calendar.detailed import DetailedTelegramCalendar, NOTHING, _month_weeks
 
 myPath = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, myPath + '/../')
@@ -62,3 +62,26 @@ def test__build_nav_buttons(step, start, diff, mind, maxd, min_button_date, max_
             result = False
 
     assert result
+
+
+@pytest.mark.parametrize(('start', 'mind', 'maxd', 'first', 'last', 'length', 'valid'),
+                         [(date(2021, 2, 1), None, None, date(2021, 2, 1), date(2021, 2, 28), 28, 28),
+                          (date(2021, 3, 1), None, None, date(2021, 3, 1), None, 35, 31),
+                          (date(2021, 3, 1), date(2021, 3, 10), date(2021, 3, 20), None, None, 35, 11)])
+def test__get_period_day(start, mind, maxd, first, last, length, valid):
+    calendar = DetailedTelegramCalendar(current_date=start, min_date=mind, max_date=maxd)
+    dates = calendar._get_period(DAY, start, 0)
+
+    assert len(dates) == length
+    assert dates[0] == first and dates[-1] == last
+    assert len([d for d in dates if d]) == valid
+
+
+@pytest.mark.parametrize(('year', 'month', 'firstweekday', 'first_week', 'weeks'),
+                         [(2021, 3, 0, (1, 2, 3, 4, 5, 6, 7), 5),
+                          (2021, 3, 6, (0, 1, 2, 3, 4, 5, 6), 5),
+                          (2021, 5, 6, (0, 0, 0, 0, 0, 0, 1), 6)])
+def test__month_weeks(year, month, firstweekday, first_week, weeks):
+    grid = _month_weeks(year, month, firstweekday)
+
+    assert grid[0] == first_week and len(grid) == weeks